@@ -7,14 +7,15 @@ Checks claim-to-evidence coverage, citation presence, and contradiction risk.
 from __future__ import annotations
 
 import argparse
+import heapq
 import os
 import re
 from dataclasses import dataclass
-from typing import Any, Dict, List, Tuple
+from typing import AbstractSet, Any, Dict, Iterator, List, Optional, Tuple
 
 from common import (
     ensure_dir,
-    keyword_overlap_score,
+    keyword_overlap_score_pretokenized,
     parse_citation_markers,
     read_json,
     sanitize_inline,
@@ -26,6 +27,14 @@ from common import (
 ABSOLUTE_TERMS = {"always", "never", "only", "all", "none", "must", "cannot"}
 CONTRAST_TERMS = {"however", "although", "but", "yet", "nevertheless", "some", "many", "often"}
 
+# One alternation per term set scans text once instead of once per term.
+# Matching is substring-based, same as `term in text`.
+_ABSOLUTE_RE = re.compile("|".join(re.escape(term) for term in sorted(ABSOLUTE_TERMS)))
+_CONTRAST_RE = re.compile("|".join(re.escape(term) for term in sorted(CONTRAST_TERMS)))
+
+_PARA_SPLIT_RE = re.compile(r"\n\s*\n")
+_SENT_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
+
 
 @dataclass
 class ClaimAudit:
@@ -38,21 +47,19 @@ class ClaimAudit:
     issues: List[str]
 
 
-def split_paragraphs(text: str) -> List[str]:
-    paras = [p.strip() for p in re.split(r"\n\s*\n", text) if p.strip()]
-    cleaned = []
-    for p in paras:
-        if p.startswith("#"):
-            continue
-        if p.startswith("```"):
+def split_paragraphs(text: str) -> Iterator[str]:
+    for part in _PARA_SPLIT_RE.split(text):
+        p = part.strip()
+        if not p or p.startswith("#") or p.startswith("```"):
             continue
-        cleaned.append(p)
-    return cleaned
+        yield p
 
 
-def split_sentences(paragraph: str) -> List[str]:
-    parts = re.split(r"(?<=[.!?])\s+", paragraph)
-    return [" ".join(p.split()) for p in parts if len(" ".join(p.split())) >= 25]
+def split_sentences(paragraph: str) -> Iterator[str]:
+    for part in _SENT_SPLIT_RE.split(paragraph):
+        sentence = " ".join(part.split())
+        if len(sentence) >= 25:
+            yield sentence
 
 
 def looks_like_claim(sentence: str) -> bool:
@@ -62,86 +69,89 @@ def looks_like_claim(sentence: str) -> bool:
     return len(words) >= 6
 
 
+def pool_entry(item: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    text = str(item.get("highlightedText") or item.get("matchedText") or "").strip()
+    if not text:
+        return None
+    note = str(item.get("note") or "")
+    combined = f"{text}\n{note}"
+    return {
+        "annotationId": item.get("annotationId"),
+        "documentFilename": item.get("documentFilename"),
+        "text": text,
+        "note": note,
+        "category": item.get("category"),
+        # Computed once here; every claim sentence is scored against the pool.
+        "_tokens": frozenset(tokenize(combined)),
+        "_has_contrast": _CONTRAST_RE.search(combined.lower()) is not None,
+    }
+
+
 def evidence_pool(evidence_payload: Dict[str, Any]) -> List[Dict[str, Any]]:
     pool = []
     for item in evidence_payload.get("evidence", []):
-        text = str(item.get("highlightedText") or item.get("matchedText") or "").strip()
-        if not text:
-            continue
-        pool.append(
-            {
-                "annotationId": item.get("annotationId"),
-                "documentFilename": item.get("documentFilename"),
-                "text": text,
-                "note": str(item.get("note") or ""),
-                "category": item.get("category"),
-            }
-        )
+        entry = pool_entry(item)
+        if entry is not None:
+            pool.append(entry)
     return pool
 
 
-def supporting_evidence(sentence: str, pool: List[Dict[str, Any]], top_n: int = 3) -> Tuple[float, List[str]]:
+def has_absolute_term(sentence: str) -> bool:
+    return _ABSOLUTE_RE.search(sentence.lower()) is not None
+
+
+def score_sentence(
+    sent_tokens: AbstractSet[str],
+    pool: List[Dict[str, Any]],
+    check_contradiction: bool,
+    top_n: int = 3,
+) -> Tuple[float, List[str], bool]:
     scored = []
+    contradiction = False
     for entry in pool:
-        score = keyword_overlap_score(sentence, f"{entry['text']}\n{entry['note']}")
-        if score <= 0:
+        overlap = keyword_overlap_score_pretokenized(sent_tokens, entry["_tokens"])
+        if overlap <= 0:
             continue
-        ref = f"{entry.get('annotationId') or 'n/a'} @ {entry.get('documentFilename') or 'Unknown'}"
-        scored.append((score, ref))
+        scored.append((overlap, entry))
+        if check_contradiction and overlap >= 0.22 and entry["_has_contrast"]:
+            contradiction = True
 
-    scored.sort(key=lambda t: t[0], reverse=True)
-    top = scored[:top_n]
+    # nlargest is stable like sort(reverse=True), so ties keep pool order.
+    top = heapq.nlargest(top_n, scored, key=lambda t: t[0])
     if not top:
-        return 0.0, []
+        return 0.0, [], contradiction
     avg = sum(s for s, _ in top) / len(top)
-    return avg, [r for _, r in top]
-
-
-def contradiction_risk(sentence: str, pool: List[Dict[str, Any]]) -> bool:
-    sent_lower = sentence.lower()
-    has_absolute = any(term in sent_lower for term in ABSOLUTE_TERMS)
-    if not has_absolute:
-        return False
-
-    related = [
-        entry
-        for entry in pool
-        if keyword_overlap_score(sentence, f"{entry['text']}\n{entry['note']}") >= 0.22
+    refs = [
+        f"{entry.get('annotationId') or 'n/a'} @ {entry.get('documentFilename') or 'Unknown'}"
+        for _, entry in top
     ]
-    if not related:
-        return False
-
-    contrast_hits = 0
-    for entry in related:
-        merged = f"{entry['text']} {entry['note']}".lower()
-        if any(term in merged for term in CONTRAST_TERMS):
-            contrast_hits += 1
-    return contrast_hits >= 1
+    return avg, refs, contradiction
 
 
-def audit(draft_text: str, evidence_payload: Dict[str, Any]) -> Dict[str, Any]:
-    paragraphs = split_paragraphs(draft_text)
-    pool = evidence_pool(evidence_payload)
-
+def audit(draft_text: str, pool: List[Dict[str, Any]]) -> Dict[str, Any]:
     claim_audits: List[ClaimAudit] = []
 
-    for p_index, paragraph in enumerate(paragraphs):
+    for p_index, paragraph in enumerate(split_paragraphs(draft_text)):
         markers = parse_citation_markers(paragraph)
         has_marker = bool(markers)
-        sentences = split_sentences(paragraph)
 
-        for sentence in sentences:
+        for sentence in split_sentences(paragraph):
             if not looks_like_claim(sentence):
                 continue
 
-            support_score, refs = supporting_evidence(sentence, pool)
+            sent_tokens = frozenset(tokenize(sentence))
+            support_score, refs, contradiction = score_sentence(
+                sent_tokens,
+                pool,
+                check_contradiction=has_absolute_term(sentence),
+            )
             issues: List[str] = []
 
             if not has_marker:
                 issues.append("missing_citation_marker")
             if support_score < 0.16:
                 issues.append("weak_or_missing_evidence")
-            if contradiction_risk(sentence, pool):
+            if contradiction:
                 issues.append("potential_contradiction")
 
             if not issues:
@@ -242,7 +252,7 @@ def main() -> int:
         draft_text = fh.read()
     evidence_payload = read_json(args.evidence)
 
-    report = audit(draft_text, evidence_payload)
+    report = audit(draft_text, evidence_pool(evidence_payload))
 
     out_md = os.path.abspath(args.out_md)
     ensure_dir(os.path.dirname(out_md))
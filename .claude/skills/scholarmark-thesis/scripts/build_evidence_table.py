@@ -12,19 +12,22 @@ from __future__ import annotations
 
 import argparse
 import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Sequence
 
 from common import (
+    MAX_WORKERS,
     api_json,
     detect_ocr_artifact,
     ensure_dir,
     generate_query_variants,
-    keyword_overlap_score,
+    keyword_overlap_score_pretokenized,
     markdown_escape,
     runtime_config,
     sanitize_inline,
     stable_evidence_key,
+    tokenize,
     utc_now_iso,
     write_json,
 )
@@ -50,47 +53,54 @@ def _safe_float(value: Any, default: float = 0.0) -> float:
         return default
 
 
+_PRIORITY = {
+    "evidence": 0.12,
+    "key_quote": 0.10,
+    "argument": 0.08,
+    "methodology": 0.04,
+}
+
+
 def _annotation_priority(category: Optional[str]) -> float:
     if not category:
         return 0.0
-    category = category.lower()
-    if category == "evidence":
-        return 0.12
-    if category == "key_quote":
-        return 0.10
-    if category == "argument":
-        return 0.08
-    if category == "methodology":
-        return 0.04
-    return 0.02
-
-
-def rerank_score(question: str, item: Dict[str, Any]) -> float:
-    similarity = _safe_float(item.get("similarityScore"), 0.0)
-    if similarity > 1.0:
-        similarity = similarity / 100.0
-
-    quote = str(item.get("highlightedText") or item.get("matchedText") or "")
-    note = str(item.get("note") or "")
-    context_text = f"{quote}\n{note}\n{item.get('documentFilename', '')}"
-
-    relevance = keyword_overlap_score(question, context_text)
-    citation_bonus = 0.08 if item.get("citationData") else 0.0
-    note_bonus = 0.03 if note else 0.0
-    category_bonus = _annotation_priority(item.get("category"))
-
-    artifact, _ = detect_ocr_artifact(quote)
-    artifact_penalty = 0.08 if artifact else 0.0
-
-    score = (
-        0.60 * similarity
-        + 0.28 * relevance
-        + citation_bonus
-        + note_bonus
-        + category_bonus
-        - artifact_penalty
-    )
-    return round(score, 4)
+    return _PRIORITY.get(category.lower(), 0.02)
+
+
+def rerank_score_batch(question: str, items: Sequence[Dict[str, Any]]) -> List[float]:
+    question_tokens = frozenset(tokenize(question))
+    scores = []
+    for item in items:
+        similarity = _safe_float(item.get("similarityScore"), 0.0)
+        if similarity > 1.0:
+            similarity = similarity / 100.0
+
+        quote = str(item.get("highlightedText") or item.get("matchedText") or "")
+        note = str(item.get("note") or "")
+        context_text = f"{quote}\n{note}\n{item.get('documentFilename', '')}"
+
+        relevance = keyword_overlap_score_pretokenized(question_tokens, frozenset(tokenize(context_text)))
+        citation_bonus = 0.08 if item.get("citationData") else 0.0
+        note_bonus = 0.03 if note else 0.0
+        category_bonus = _annotation_priority(item.get("category"))
+
+        # Evidence rows already carry the OCR check for this quote.
+        if "hasOcrArtifact" in item:
+            artifact = bool(item["hasOcrArtifact"])
+        else:
+            artifact, _ = detect_ocr_artifact(quote)
+        artifact_penalty = 0.08 if artifact else 0.0
+
+        score = (
+            0.60 * similarity
+            + 0.28 * relevance
+            + citation_bonus
+            + note_bonus
+            + category_bonus
+            - artifact_penalty
+        )
+        scores.append(round(score, 4))
+    return scores
 
 
 def fetch_project_search(
@@ -128,14 +138,33 @@ def fetch_doc_semantic_search(
     return payload if isinstance(payload, list) else []
 
 
+def _fetch_doc_semantic_search_or_none(
+    sm: str,
+    project_document_id: str,
+    query: str,
+) -> Optional[List[Dict[str, Any]]]:
+    try:
+        return fetch_doc_semantic_search(sm, project_document_id, query)
+    except Exception:
+        return None
+
+
 def gather_evidence(options: EvidenceOptions) -> Dict[str, Any]:
     seen_keys = set()
     evidence_rows: List[Dict[str, Any]] = []
 
     raw_search_stats = []
 
-    for query in options.queries:
-        result = fetch_project_search(options.sm, options.pid, query, options.limit_per_query)
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        search_payloads = list(
+            executor.map(
+                lambda query: fetch_project_search(options.sm, options.pid, query, options.limit_per_query),
+                options.queries,
+            )
+        )
+
+    # Merge in query order so dedupe and tie-breaking stay deterministic.
+    for query, result in zip(options.queries, search_payloads):
         results = result.get("results") if isinstance(result, dict) else []
         if not isinstance(results, list):
             results = []
@@ -181,7 +210,6 @@ def gather_evidence(options: EvidenceOptions) -> Dict[str, Any]:
                 "hasOcrArtifact": artifact,
                 "ocrArtifactReasons": reasons,
             }
-            row["reRankScore"] = rerank_score(options.question, row)
             evidence_rows.append(row)
 
     if options.include_semantic:
@@ -189,17 +217,25 @@ def gather_evidence(options: EvidenceOptions) -> Dict[str, Any]:
         ranked_docs = docs[: options.max_semantic_docs]
 
         semantic_query = options.queries[0] if options.queries else options.question
-        for doc in ranked_docs:
-            pd_id = doc.get("id")
-            if not pd_id:
-                continue
-            try:
-                snippets = fetch_doc_semantic_search(options.sm, pd_id, semantic_query)
-            except Exception:
+        searchable_docs = [doc for doc in ranked_docs if doc.get("id")]
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            snippet_lists = list(
+                executor.map(
+                    lambda doc: _fetch_doc_semantic_search_or_none(options.sm, doc["id"], semantic_query),
+                    searchable_docs,
+                )
+            )
+
+        for doc, snippets in zip(searchable_docs, snippet_lists):
+            if snippets is None:
                 continue
+            pd_id = doc["id"]
+            document_id = doc.get("documentId")
+            document_filename = (doc.get("document") or {}).get("filename")
 
             for snippet in snippets[: options.semantic_per_doc]:
-                text = str(snippet.get("text") or "").strip()
+                snippet_get = snippet.get
+                text = str(snippet_get("text") or "").strip()
                 if not text:
                     continue
 
@@ -209,26 +245,31 @@ def gather_evidence(options: EvidenceOptions) -> Dict[str, Any]:
                     "type": "semantic_chunk",
                     "annotationId": None,
                     "projectDocumentId": pd_id,
-                    "documentId": doc.get("documentId"),
-                    "documentFilename": (doc.get("document") or {}).get("filename"),
+                    "documentId": document_id,
+                    "documentFilename": document_filename,
                     "category": None,
                     "note": "Semantic retrieval candidate. Requires manual quote confirmation before citation.",
                     "matchedText": text,
                     "highlightedText": text,
                     "citationData": None,
-                    "similarityScore": _safe_float(snippet.get("similarity"), 0.0),
+                    "similarityScore": _safe_float(snippet_get("similarity"), 0.0),
                     "relevanceLevel": "medium",
-                    "startPosition": snippet.get("startPosition"),
-                    "hasOcrArtifact": detect_ocr_artifact(text)[0],
-                    "ocrArtifactReasons": detect_ocr_artifact(text)[1],
+                    "startPosition": snippet_get("startPosition"),
                 }
                 key = stable_evidence_key(pseudo)
                 if key in seen_keys:
                     continue
                 seen_keys.add(key)
-                pseudo["reRankScore"] = rerank_score(options.question, pseudo)
+
+                # Only rows that survive dedupe pay for OCR detection.
+                artifact, reasons = detect_ocr_artifact(text)
+                pseudo["hasOcrArtifact"] = artifact
+                pseudo["ocrArtifactReasons"] = reasons
                 evidence_rows.append(pseudo)
 
+    for row, score in zip(evidence_rows, rerank_score_batch(options.question, evidence_rows)):
+        row["reRankScore"] = score
+
     evidence_rows.sort(key=lambda r: r.get("reRankScore", 0.0), reverse=True)
     top_rows = evidence_rows[: options.top_n]
 
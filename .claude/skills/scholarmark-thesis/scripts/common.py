@@ -3,19 +3,42 @@
 
 from __future__ import annotations
 
+import atexit
+import base64
+import functools
+import http.client
 import json
 import os
 import re
 import ssl
-import urllib.error
+import threading
+import urllib.parse
 import urllib.request
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from typing import AbstractSet, Any, Dict, Iterable, List, Optional, Sequence, TextIO, Tuple
+
+try:
+    import orjson
+except ImportError:  # Optional speedup; stdlib json is the fallback.
+    orjson = None
 
 DEFAULT_TIMEOUT = 90
+# Thread pool size for the scripts' concurrent API fan-out.
+MAX_WORKERS = 8
 DEFAULT_SM = "http://89.167.10.34:5001"
 DEFAULT_PID = "cf547e4d-712b-42a1-a33d-6cb67e68e670"
+# Reports are written line by line; a large buffer keeps that to a few syscalls.
+REPORT_BUFFER_SIZE = 1 << 20
+
+_TOKEN_RE = re.compile(r"[^a-zA-Z0-9]+")
+_WS_RE = re.compile(r"\s+")
+_YEAR_RE = re.compile(r"\b(1[89]\d{2}|20\d{2})\b")
+_HYPHEN_RE = re.compile(r"\b[a-zA-Z]{1,2}-\s+[a-zA-Z]{2,}\b")
+_SPACED_UPPER_RE = re.compile(r"\b[A-Z](?:\s+[A-Z]){5,}\b")
+_NON_ASCII_RE = re.compile(r"[^\x09\x0A\x0D\x20-\x7E]")
+# Footnote refs, parenthetical author-year cites, and numeric bracket cites.
+_CITE_RE = re.compile(r"\[\^[^\]]+\]|\((?:[^()]*\d{4}[^()]*)\)|\[[0-9]{1,3}\]")
 
 
 class ApiError(RuntimeError):
@@ -43,10 +66,149 @@ def utc_now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
-def _ssl_context_for(url: str) -> Optional[ssl.SSLContext]:
-    if url.startswith("https://"):
-        return ssl.create_default_context()
-    return None
+def _json_bytes(payload: Any, pretty: bool = False) -> bytes:
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        return orjson.dumps(payload, option=option)
+    if pretty:
+        return json.dumps(payload, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(payload).encode("utf-8")
+
+
+def _json_loads(data: Any) -> Any:
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def canonical_json(payload: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+_IDLE_CONNECTIONS: Dict[Tuple[str, str], List[http.client.HTTPConnection]] = {}
+_IDLE_LOCK = threading.Lock()
+MAX_IDLE_PER_HOST = MAX_WORKERS
+# Caps in-flight requests across all threads, so nested fan-out (evaluation cases
+# each running the evidence pipeline) never exceeds MAX_WORKERS against the server.
+_REQUEST_SLOTS = threading.BoundedSemaphore(MAX_WORKERS)
+# Same redirect handling as urllib's HTTPRedirectHandler, which api_json used to rely on.
+_REDIRECT_STATUSES = (301, 302, 303, 307, 308)
+MAX_REDIRECTS = 10
+
+
+# Loading the CA bundle is the slow part of building a context; share one across
+# all threads' connections (SSLContext is safe to use concurrently).
+@functools.lru_cache(maxsize=None)
+def _ssl_context() -> ssl.SSLContext:
+    return ssl.create_default_context()
+
+
+@functools.lru_cache(maxsize=None)
+def _proxy_for(scheme: str, host: str) -> Optional[urllib.parse.SplitResult]:
+    # Honour HTTP(S)_PROXY and NO_PROXY the way urllib.request.urlopen does.
+    proxy = urllib.request.getproxies().get(scheme)
+    if not proxy or urllib.request.proxy_bypass(host):
+        return None
+    if "://" not in proxy:
+        proxy = f"http://{proxy}"
+    return urllib.parse.urlsplit(proxy)
+
+
+def _proxy_headers(proxy: urllib.parse.SplitResult) -> Dict[str, str]:
+    if proxy.username is None:
+        return {}
+    creds = f"{urllib.parse.unquote(proxy.username)}:{urllib.parse.unquote(proxy.password or '')}"
+    return {"Proxy-Authorization": "Basic " + base64.b64encode(creds.encode("utf-8")).decode("ascii")}
+
+
+def _new_connection(url: urllib.parse.SplitResult, timeout: int) -> http.client.HTTPConnection:
+    if url.scheme not in ("http", "https"):
+        raise RuntimeError(f"Unsupported URL scheme: {url.scheme!r}")
+    proxy = _proxy_for(url.scheme, url.hostname or "")
+    if proxy is None:
+        host = url.netloc
+    else:
+        host = f"{proxy.hostname}:{proxy.port or 80}"
+    if url.scheme == "https":
+        conn = http.client.HTTPSConnection(host, timeout=timeout, context=_ssl_context())
+        if proxy is not None:
+            conn.set_tunnel(url.hostname or "", url.port or 443, headers=_proxy_headers(proxy))
+        return conn
+    return http.client.HTTPConnection(host, timeout=timeout)
+
+
+def _checkout(url: urllib.parse.SplitResult, timeout: int) -> Tuple[http.client.HTTPConnection, bool]:
+    # Idle keep-alive connections are shared process-wide, so they outlive the
+    # short-lived executor threads that make most requests.
+    with _IDLE_LOCK:
+        idle = _IDLE_CONNECTIONS.get((url.scheme, url.netloc))
+        conn = idle.pop() if idle else None
+    if conn is None:
+        return _new_connection(url, timeout), False
+    conn.timeout = timeout
+    if conn.sock is not None:
+        conn.sock.settimeout(timeout)
+    return conn, True
+
+
+def _checkin(url: urllib.parse.SplitResult, conn: http.client.HTTPConnection) -> None:
+    with _IDLE_LOCK:
+        idle = _IDLE_CONNECTIONS.setdefault((url.scheme, url.netloc), [])
+        if len(idle) < MAX_IDLE_PER_HOST:
+            idle.append(conn)
+            return
+    conn.close()
+
+
+@atexit.register
+def _close_idle_connections() -> None:
+    with _IDLE_LOCK:
+        conns = [conn for idle in _IDLE_CONNECTIONS.values() for conn in idle]
+        _IDLE_CONNECTIONS.clear()
+    for conn in conns:
+        conn.close()
+
+
+def _send(
+    url: urllib.parse.SplitResult,
+    method: str,
+    body: Optional[bytes],
+    headers: Dict[str, str],
+    timeout: int,
+    path: str,
+) -> Tuple[int, Optional[str], bytes]:
+    target = f"{url.path or '/'}?{url.query}" if url.query else url.path or "/"
+    proxy = _proxy_for(url.scheme, url.hostname or "")
+    if proxy is not None and url.scheme == "http":
+        # A plain HTTP proxy takes the absolute URL as the request target.
+        target = urllib.parse.urlunsplit((url.scheme, url.netloc, url.path or "/", url.query, ""))
+        headers = {**headers, **_proxy_headers(proxy)}
+
+    while True:
+        conn, reused = _checkout(url, timeout)
+        try:
+            conn.request(method, target, body=body, headers=headers)
+            response = conn.getresponse()
+            result = response.status, response.getheader("Location"), response.read()
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError) as exc:
+            conn.close()
+            # The server may close an idle keep-alive socket; retry once on a fresh connection.
+            if not reused:
+                raise RuntimeError(f"Request failed for {path}: {exc}") from exc
+            continue
+        except (OSError, http.client.HTTPException) as exc:
+            conn.close()
+            raise RuntimeError(f"Request failed for {path}: {exc}") from exc
+        except BaseException:
+            # Any other failure can leave the connection mid-request; never reuse it.
+            conn.close()
+            raise
+
+        if response.will_close:
+            conn.close()
+        else:
+            _checkin(url, conn)
+        return result
 
 
 def api_json(
@@ -57,61 +219,61 @@ def api_json(
     timeout: int = DEFAULT_TIMEOUT,
     expected_statuses: Sequence[int] = (200,),
 ) -> Any:
-    url = f"{sm}{path}"
+    url = urllib.parse.urlsplit(f"{sm}{path}")
+    method = method.upper()
     data = None
     headers = {"Accept": "application/json"}
     if payload is not None:
-        data = json.dumps(payload).encode("utf-8")
+        data = _json_bytes(payload)
         headers["Content-Type"] = "application/json"
 
-    request = urllib.request.Request(url=url, method=method.upper(), data=data, headers=headers)
-
+    redirects = 0
+    while True:
+        with _REQUEST_SLOTS:
+            status, location, body_bytes = _send(url, method, data, headers, timeout, path)
+        if status not in _REDIRECT_STATUSES or not location:
+            break
+        # GET/HEAD follow any redirect; POST follows 301/302/303 as a bodiless GET.
+        # Anything else surfaces the redirect status, as urllib does.
+        if method not in ("GET", "HEAD") and not (method == "POST" and status in (301, 302, 303)):
+            break
+        redirects += 1
+        next_url = urllib.parse.urlsplit(urllib.parse.urljoin(url.geturl(), location))
+        if redirects > MAX_REDIRECTS or next_url.scheme not in ("http", "https"):
+            raise ApiError(status, path, f"Redirect not followed: {location}")
+        url = next_url
+        if method == "POST":
+            method = "GET"
+            data = None
+            headers = {"Accept": "application/json"}
+
+    body_text = body_bytes.decode("utf-8", errors="replace")
+    if status not in expected_statuses:
+        raise ApiError(status, path, body_text[:500])
+    if not body_text.strip():
+        return None
     try:
-        with urllib.request.urlopen(request, timeout=timeout, context=_ssl_context_for(url)) as response:
-            status = response.getcode()
-            body_bytes = response.read()
-            body_text = body_bytes.decode("utf-8", errors="replace")
-            if status not in expected_statuses:
-                raise ApiError(status, path, body_text[:500])
-            if not body_text.strip():
-                return None
-            try:
-                return json.loads(body_text)
-            except json.JSONDecodeError as exc:
-                raise ApiError(status, path, f"Invalid JSON response: {exc}") from exc
-    except urllib.error.HTTPError as exc:
-        body = exc.read().decode("utf-8", errors="replace")
-        if exc.code not in expected_statuses:
-            raise ApiError(exc.code, path, body[:500]) from exc
-        if not body.strip():
-            return None
-        return json.loads(body)
-    except urllib.error.URLError as exc:
-        raise RuntimeError(f"Request failed for {path}: {exc}") from exc
+        return _json_loads(body_text)
+    except json.JSONDecodeError as exc:
+        raise ApiError(status, path, f"Invalid JSON response: {exc}") from exc
 
 
 def tokenize(text: str) -> List[str]:
-    return [t for t in re.split(r"[^a-zA-Z0-9]+", text.lower()) if len(t) >= 3]
+    return [t for t in _TOKEN_RE.split(text.lower()) if len(t) >= 3]
 
 
 def unique_preserve_order(items: Iterable[str]) -> List[str]:
-    seen = set()
-    ordered = []
-    for item in items:
-        if item in seen:
-            continue
-        seen.add(item)
-        ordered.append(item)
-    return ordered
+    return list(dict.fromkeys(items))
 
 
 def keyword_overlap_score(a: str, b: str) -> float:
-    a_tokens = set(tokenize(a))
-    b_tokens = set(tokenize(b))
+    return keyword_overlap_score_pretokenized(set(tokenize(a)), set(tokenize(b)))
+
+
+def keyword_overlap_score_pretokenized(a_tokens: AbstractSet[str], b_tokens: AbstractSet[str]) -> float:
     if not a_tokens or not b_tokens:
         return 0.0
-    inter = a_tokens.intersection(b_tokens)
-    return len(inter) / max(len(a_tokens), 1)
+    return len(a_tokens & b_tokens) / max(len(a_tokens), 1)
 
 
 def generate_query_variants(question: str) -> List[str]:
@@ -135,7 +297,7 @@ def generate_query_variants(question: str) -> List[str]:
 
 
 def sanitize_inline(text: str, limit: int = 240) -> str:
-    compact = " ".join(text.replace("\n", " ").split())
+    compact = _WS_RE.sub(" ", text).strip()
     if len(compact) <= limit:
         return compact
     return compact[: limit - 1] + "…"
@@ -145,14 +307,28 @@ def ensure_dir(path: str) -> None:
     os.makedirs(path, exist_ok=True)
 
 
+def open_report(path: str) -> TextIO:
+    return open(path, "w", encoding="utf-8", buffering=REPORT_BUFFER_SIZE)
+
+
 def write_json(path: str, payload: Any) -> None:
-    with open(path, "w", encoding="utf-8") as fh:
-        json.dump(payload, fh, indent=2, ensure_ascii=False)
+    # Serialize first, then swap in a fully written file so readers and crashes
+    # never see a truncated JSON document.
+    data = _json_bytes(payload, pretty=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "wb") as fh:
+            fh.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
 
 
 def read_json(path: str) -> Any:
-    with open(path, "r", encoding="utf-8") as fh:
-        return json.load(fh)
+    with open(path, "rb") as fh:
+        return _json_loads(fh.read())
 
 
 def markdown_escape(text: str) -> str:
@@ -171,33 +347,35 @@ def stable_evidence_key(item: Dict[str, Any]) -> str:
 
 
 def extract_year_markers(text: str) -> List[str]:
-    return re.findall(r"\b(1[89]\d{2}|20\d{2})\b", text)
+    return _YEAR_RE.findall(text)
 
 
 def detect_ocr_artifact(text: str) -> Tuple[bool, List[str]]:
     if not text:
         return False, []
 
+    # Fast negative: printable ASCII with no hyphen and no capitals cannot trip any check.
+    if text.isascii() and text.isprintable() and "-" not in text and text.islower():
+        return False, []
+
     reasons: List[str] = []
 
     if "�" in text:
         reasons.append("replacement-character")
 
-    if re.search(r"\b[a-zA-Z]{1,2}-\s+[a-zA-Z]{2,}\b", text):
+    # Cheap C-level guards first; the regexes only run on text that could match.
+    if "-" in text and _HYPHEN_RE.search(text):
         reasons.append("line-break-hyphenation")
 
-    if re.search(r"\b[A-Z](?:\s+[A-Z]){5,}\b", text):
+    if _SPACED_UPPER_RE.search(text):
         reasons.append("spaced-uppercase-run")
 
-    if re.search(r"[^\x09\x0A\x0D\x20-\x7E]", text):
+    # Printable ASCII (the usual case) cannot match; tab/newline/CR still need the regex.
+    if not text.isascii() or (not text.isprintable() and _NON_ASCII_RE.search(text)):
         reasons.append("non-ascii-glyphs")
 
     return bool(reasons), reasons
 
 
 def parse_citation_markers(text: str) -> List[str]:
-    markers = []
-    markers.extend(re.findall(r"\[\^[^\]]+\]", text))
-    markers.extend(re.findall(r"\((?:[^()]*\d{4}[^()]*)\)", text))
-    markers.extend(re.findall(r"\[[0-9]{1,3}\]", text))
-    return unique_preserve_order(markers)
+    return unique_preserve_order(match.group(0) for match in _CITE_RE.finditer(text))
@@ -5,28 +5,90 @@ from __future__ import annotations
 
 import argparse
 import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from statistics import mean
-from typing import Any, Dict, List
+from typing import Any, Dict, List, TextIO
 
 from build_evidence_table import run_pipeline
-from common import ensure_dir, keyword_overlap_score, read_json, runtime_config, sanitize_inline, write_json
+from common import (
+    MAX_WORKERS,
+    ensure_dir,
+    keyword_overlap_score,
+    open_report,
+    read_json,
+    runtime_config,
+    sanitize_inline,
+    write_json,
+)
+
+_REPORT_ROW = "| {name} | {status} | {evidence} | {recall:.3f} | {score:.3f} |".format
+
+
+@dataclass
+class CaseResult:
+    # Explicit slots (rather than slots=True) keep the scripts importable on 3.9.
+    __slots__ = (
+        "name",
+        "question",
+        "passed",
+        "evidence_count",
+        "min_evidence",
+        "required_term_recall",
+        "min_recall",
+        "avg_rerank_score",
+        "top_quote",
+        "counts",
+    )
+
+    name: str
+    question: str
+    passed: bool
+    evidence_count: int
+    min_evidence: int
+    required_term_recall: float
+    min_recall: float
+    avg_rerank_score: float
+    top_quote: str
+    counts: Dict[str, Any]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "question": self.question,
+            "passed": self.passed,
+            "evidenceCount": self.evidence_count,
+            "minEvidence": self.min_evidence,
+            "requiredTermRecall": self.required_term_recall,
+            "minRecall": self.min_recall,
+            "avgReRankScore": self.avg_rerank_score,
+            "topQuote": self.top_quote,
+            "counts": self.counts,
+        }
 
 
 def term_recall(evidence_rows: List[Dict[str, Any]], terms: List[str]) -> float:
     if not terms:
         return 1.0
 
+    # Lowercase field by field and skip missing ones, so a None note does not
+    # put the literal "none" into the corpus.
     corpus = "\n".join(
-        f"{row.get('highlightedText', '')}\n{row.get('note', '')}\n{row.get('documentFilename', '')}"
+        str(value).lower()
         for row in evidence_rows
-    ).lower()
+        for value in (row.get("highlightedText"), row.get("note"), row.get("documentFilename"))
+        if value
+    )
 
-    hits = sum(1 for term in terms if term.lower() in corpus)
+    # Terms match as substrings; each distinct term is scanned once.
+    lowered = [term.lower() for term in terms]
+    found = {term for term in set(lowered) if term in corpus}
+    hits = sum(1 for term in lowered if term in found)
     return hits / max(len(terms), 1)
 
 
-def evaluate_case(sm: str, pid: str, case: Dict[str, Any]) -> Dict[str, Any]:
+def evaluate_case(sm: str, pid: str, case: Dict[str, Any]) -> CaseResult:
     name = str(case.get("name") or "unnamed-case")
     question = str(case.get("question") or "").strip()
     if not question:
@@ -58,47 +120,45 @@ def evaluate_case(sm: str, pid: str, case: Dict[str, Any]) -> Dict[str, Any]:
 
     passed = evidence_count >= min_evidence and recall >= pass_threshold
 
-    return {
-        "name": name,
-        "question": question,
-        "passed": passed,
-        "evidenceCount": evidence_count,
-        "minEvidence": min_evidence,
-        "requiredTermRecall": round(recall, 3),
-        "minRecall": pass_threshold,
-        "avgReRankScore": round(avg_score, 3),
-        "topQuote": top_quote,
-        "counts": payload.get("counts", {}),
-    }
+    return CaseResult(
+        name=name,
+        question=question,
+        passed=passed,
+        evidence_count=evidence_count,
+        min_evidence=min_evidence,
+        required_term_recall=round(recall, 3),
+        min_recall=pass_threshold,
+        avg_rerank_score=round(avg_score, 3),
+        top_quote=top_quote,
+        counts=payload.get("counts", {}),
+    )
 
 
-def markdown_report(results: List[Dict[str, Any]]) -> str:
-    lines = []
-    lines.append("# Evaluation Report")
-    lines.append("")
-    passed = sum(1 for r in results if r.get("passed"))
-    lines.append(f"- Cases: {len(results)}")
-    lines.append(f"- Passed: {passed}")
-    lines.append(f"- Failed: {len(results) - passed}")
-    lines.append("")
+def write_markdown_report(fh: TextIO, results: List[CaseResult]) -> None:
+    passed = sum(1 for r in results if r.passed)
+    fh.write("# Evaluation Report\n\n")
+    fh.write(f"- Cases: {len(results)}\n")
+    fh.write(f"- Passed: {passed}\n")
+    fh.write(f"- Failed: {len(results) - passed}\n\n")
 
-    lines.append("| Case | Status | Evidence | Recall | Avg Score |")
-    lines.append("|---|---|---:|---:|---:|")
+    fh.write("| Case | Status | Evidence | Recall | Avg Score |\n")
+    fh.write("|---|---|---:|---:|---:|\n")
     for row in results:
-        status = "PASS" if row.get("passed") else "FAIL"
-        lines.append(
-            f"| {row.get('name')} | {status} | {row.get('evidenceCount')} | "
-            f"{row.get('requiredTermRecall'):.3f} | {row.get('avgReRankScore'):.3f} |"
+        fh.write(
+            _REPORT_ROW(
+                name=row.name,
+                status="PASS" if row.passed else "FAIL",
+                evidence=row.evidence_count,
+                recall=row.required_term_recall,
+                score=row.avg_rerank_score,
+            )
         )
+        fh.write("\n")
 
-    lines.append("")
-    lines.append("## Case Notes")
-    lines.append("")
+    fh.write("\n## Case Notes\n\n")
     for row in results:
-        lines.append(f"- **{row.get('name')}** ({'PASS' if row.get('passed') else 'FAIL'})")
-        lines.append(f"  Top quote: \"{row.get('topQuote')}\"")
-    lines.append("")
-    return "\n".join(lines)
+        fh.write(f"- **{row.name}** ({'PASS' if row.passed else 'FAIL'})\n")
+        fh.write(f"  Top quote: \"{row.top_quote}\"\n")
 
 
 def parse_args() -> argparse.Namespace:
@@ -120,7 +180,8 @@ def main() -> int:
     if not isinstance(cases, list) or not cases:
         raise ValueError("Suite must contain non-empty `cases` array")
 
-    results = [evaluate_case(cfg.sm, cfg.pid, case) for case in cases]
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(cases))) as executor:
+        results = list(executor.map(lambda case: evaluate_case(cfg.sm, cfg.pid, case), cases))
 
     out_json = os.path.abspath(args.out_json)
     out_md = os.path.abspath(args.out_md)
@@ -131,17 +192,17 @@ def main() -> int:
         "generatedAt": datetime.now(timezone.utc).isoformat(),
         "suite": os.path.abspath(args.suite),
         "projectId": cfg.pid,
-        "results": results,
+        "results": [r.to_dict() for r in results],
         "totals": {
             "cases": len(results),
-            "passed": sum(1 for r in results if r.get("passed")),
-            "failed": sum(1 for r in results if not r.get("passed")),
+            "passed": sum(1 for r in results if r.passed),
+            "failed": sum(1 for r in results if not r.passed),
         },
     }
 
     write_json(out_json, summary)
-    with open(out_md, "w", encoding="utf-8") as fh:
-        fh.write(markdown_report(results))
+    with open_report(out_md) as fh:
+        write_markdown_report(fh, results)
 
     print(f"Evaluation complete: {summary['totals']['passed']}/{summary['totals']['cases']} cases passed")
     print(f"JSON: {out_json}")
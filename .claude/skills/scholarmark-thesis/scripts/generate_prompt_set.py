@@ -4,15 +4,19 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import os
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
 from common import api_json, ensure_dir, runtime_config, write_json
 
-DEFAULT_COLORS = ["#60a5fa", "#34d399", "#f59e0b", "#f472b6", "#a78bfa", "#f87171"]
+DEFAULT_COLORS = ("#60a5fa", "#34d399", "#f59e0b", "#f472b6", "#a78bfa", "#f87171")
 
 
-def build_prompt_set(topic: str, thesis: str, section_goal: str) -> List[Dict[str, str]]:
+# Keyed on the input strings only; DEFAULT_COLORS is a tuple so the cached
+# pairs cannot go stale within a process.
+@functools.lru_cache(maxsize=256)
+def _build_prompt_pairs(topic: str, thesis: str, section_goal: str) -> Tuple[Tuple[str, str], ...]:
     root = topic.strip()
     thesis_line = thesis.strip() if thesis else ""
     goal_line = section_goal.strip() if section_goal else ""
@@ -25,10 +29,11 @@ def build_prompt_set(topic: str, thesis: str, section_goal: str) -> List[Dict[st
         f"Find high-quality quotation candidates suitable for Chicago-style citation on: {root}",
     ]
 
-    structured = []
-    for idx, text in enumerate(prompts):
-        structured.append({"text": text, "color": DEFAULT_COLORS[idx % len(DEFAULT_COLORS)]})
-    return structured
+    return tuple((text, DEFAULT_COLORS[idx % len(DEFAULT_COLORS)]) for idx, text in enumerate(prompts))
+
+
+def build_prompt_set(topic: str, thesis: str, section_goal: str) -> List[Dict[str, str]]:
+    return [{"text": text, "color": color} for text, color in _build_prompt_pairs(topic, thesis, section_goal)]
 
 
 def parse_args() -> argparse.Namespace:
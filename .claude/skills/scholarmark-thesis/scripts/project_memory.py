@@ -9,9 +9,10 @@ from __future__ import annotations
 import argparse
 import os
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List
 
-from common import api_json, ensure_dir, read_json, runtime_config, utc_now_iso, write_json
+from common import MAX_WORKERS, api_json, canonical_json, ensure_dir, read_json, runtime_config, utc_now_iso, write_json
 
 
 def default_memory(pid: str) -> Dict[str, Any]:
@@ -41,6 +42,21 @@ def save_memory(path: str, payload: Dict[str, Any]) -> None:
     write_json(path, payload)
 
 
+def fetch_annotation_lists(sm: str, docs: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        return list(
+            executor.map(
+                lambda doc: api_json(
+                    sm,
+                    "GET",
+                    f"/api/project-documents/{doc['id']}/annotations",
+                    expected_statuses=(200,),
+                ),
+                docs,
+            )
+        )
+
+
 def cmd_snapshot(args: argparse.Namespace) -> int:
     cfg = runtime_config(sm=args.sm, pid=args.pid)
     memory = load_memory(args.memory_file, cfg.pid)
@@ -51,27 +67,18 @@ def cmd_snapshot(args: argparse.Namespace) -> int:
     annotation_counts = Counter()
     doc_annotation_counts = []
 
-    for doc in docs[: args.max_docs]:
-        pdid = doc.get("id")
-        if not pdid:
-            continue
-        annotations = api_json(
-            cfg.sm,
-            "GET",
-            f"/api/project-documents/{pdid}/annotations",
-            expected_statuses=(200,),
-        )
-        count = 0
-        for ann in annotations:
-            category = ann.get("category") or "unknown"
-            annotation_counts[category] += 1
-            count += 1
+    profiled_docs = [doc for doc in docs[: args.max_docs] if doc.get("id")]
+    annotation_lists = fetch_annotation_lists(cfg.sm, profiled_docs)
+
+    for doc, doc_annotations in zip(profiled_docs, annotation_lists):
+        pdid = doc["id"]
+        annotation_counts.update(ann.get("category") or "unknown" for ann in doc_annotations)
         doc_annotation_counts.append(
             {
                 "projectDocumentId": pdid,
                 "documentId": doc.get("documentId"),
                 "filename": (doc.get("document") or {}).get("filename"),
-                "annotationCount": count,
+                "annotationCount": len(doc_annotations),
             }
         )
 
@@ -110,11 +117,18 @@ def cmd_snapshot(args: argparse.Namespace) -> int:
     return 0
 
 
+def _memory_item_key(item: Any) -> Any:
+    # Structured items compare by content, independent of key order.
+    if isinstance(item, (dict, list)):
+        return canonical_json(item)
+    return str(item)
+
+
 def merge_unique_list(existing: List[Any], additions: List[Any], limit: int = 200) -> List[Any]:
     merged = list(existing)
-    seen = {str(item) for item in merged}
+    seen = {_memory_item_key(item) for item in merged}
     for item in additions:
-        key = str(item)
+        key = _memory_item_key(item)
         if key in seen:
             continue
         seen.add(key)
@@ -10,35 +10,31 @@ from __future__ import annotations
 import argparse
 import os
 import re
-from typing import Any, Dict, List
+from typing import Any, Dict, List, TextIO
 
-from common import ensure_dir, read_json, sanitize_inline, write_json
+from common import ensure_dir, open_report, read_json, sanitize_inline, unique_preserve_order, write_json
 from verify_quotes import verify
 
+# Curly and straight double quotes, keyed by opening delimiter.
+_QUOTE_PATTERNS = [
+    ('"', re.compile(r'"([^"\n]{8,}?)"', re.MULTILINE)),
+    ("“", re.compile(r"“([^”\n]{8,}?)”", re.MULTILINE)),
+]
+
 
 def extract_quotes(markdown_text: str) -> List[str]:
     quotes: List[str] = []
 
-    # Curly and straight double quotes.
-    patterns = [
-        r'"([^"\n]{8,}?)"',
-        r"“([^”\n]{8,}?)”",
-    ]
-    for pattern in patterns:
-        for match in re.findall(pattern, markdown_text, flags=re.MULTILINE):
+    # Drafts usually use one quote style; skip scans whose opener never occurs.
+    for opener, pattern in _QUOTE_PATTERNS:
+        if opener not in markdown_text:
+            continue
+        for match in pattern.findall(markdown_text):
             cleaned = " ".join(match.split())
             if len(cleaned) >= 8:
                 quotes.append(cleaned)
 
-    # Unique while preserving order.
-    seen = set()
-    ordered = []
-    for quote in quotes:
-        if quote in seen:
-            continue
-        seen.add(quote)
-        ordered.append(quote)
-    return ordered
+    return unique_preserve_order(quotes)
 
 
 def build_draft_quotes(draft_text: str) -> List[Dict[str, Any]]:
@@ -75,10 +71,8 @@ def build_source_quotes(evidence_payload: Dict[str, Any]) -> List[Dict[str, Any]
     return deduped
 
 
-def result_to_markdown(results: List[Dict[str, Any]]) -> str:
-    lines = []
-    lines.append("## Quote Verification Report")
-    lines.append("")
+def write_result_markdown(fh: TextIO, results: List[Dict[str, Any]]) -> None:
+    fh.write("## Quote Verification Report\n\n")
 
     pass_count = 0
     fail_count = 0
@@ -91,23 +85,21 @@ def result_to_markdown(results: List[Dict[str, Any]]) -> str:
             fail_count += 1
 
         icon = "PASS" if ok else "FAIL"
-        lines.append(f"- {icon} Quote {result.get('quote_index')}: {status}")
-        lines.append(f"  Draft: \"{sanitize_inline(result.get('draft', ''), 140)}\"")
+        fh.write(f"- {icon} Quote {result.get('quote_index')}: {status}\n")
+        fh.write(f"  Draft: \"{sanitize_inline(result.get('draft', ''), 140)}\"\n")
 
         if result.get("source"):
-            lines.append(f"  Source: \"{sanitize_inline(result.get('source', ''), 140)}\"")
+            fh.write(f"  Source: \"{sanitize_inline(result.get('source', ''), 140)}\"\n")
         if result.get("closest_source"):
-            lines.append(f"  Closest Source: \"{sanitize_inline(result.get('closest_source', ''), 140)}\"")
-            lines.append(f"  Similarity: {result.get('similarity')}")
+            fh.write(f"  Closest Source: \"{sanitize_inline(result.get('closest_source', ''), 140)}\"\n")
+            fh.write(f"  Similarity: {result.get('similarity')}\n")
         if result.get("note"):
-            lines.append(f"  Note: {result.get('note')}")
+            fh.write(f"  Note: {result.get('note')}\n")
         if result.get("ocrArtifactWarning"):
             reasons = ", ".join(result.get("ocrArtifactReasons") or [])
-            lines.append(f"  OCR Warning: {reasons}")
+            fh.write(f"  OCR Warning: {reasons}\n")
 
-    lines.append("")
-    lines.append(f"Summary: {pass_count} passed, {fail_count} failed")
-    return "\n".join(lines) + "\n"
+    fh.write(f"\nSummary: {pass_count} passed, {fail_count} failed\n")
 
 
 def parse_args() -> argparse.Namespace:
@@ -141,8 +133,8 @@ def main() -> int:
 
     out_md = os.path.abspath(args.out_md)
     ensure_dir(os.path.dirname(out_md))
-    with open(out_md, "w", encoding="utf-8") as fh:
-        fh.write(result_to_markdown(results))
+    with open_report(out_md) as fh:
+        write_result_markdown(fh, results)
 
     if args.out_json:
         out_json = os.path.abspath(args.out_json)
@@ -11,10 +11,10 @@ import os
 from typing import List
 
 from build_evidence_table import evidence_to_markdown, run_pipeline
-from common import ensure_dir, generate_query_variants, runtime_config, write_json
-from quote_gate import extract_quotes, result_to_markdown
+from common import ensure_dir, generate_query_variants, open_report, runtime_config, write_json
+from quote_gate import extract_quotes, write_result_markdown
 from verify_quotes import verify
-from audit_draft import audit, to_markdown as audit_to_markdown
+from audit_draft import audit, pool_entry, to_markdown as audit_to_markdown
 
 
 def build_planner_brief(question: str, section_goal: str, queries: List[str]) -> str:
@@ -122,25 +122,30 @@ def main() -> int:
         with open(draft_path, "r", encoding="utf-8") as fh:
             draft_text = fh.read()
 
-        # Quote gate.
-        source_quotes = [
-            {
-                "annotationId": item.get("annotationId"),
-                "highlightedText": item.get("highlightedText"),
-            }
-            for item in evidence_payload.get("evidence", [])
-            if item.get("sourceType") == "annotation" and item.get("highlightedText")
-        ]
+        # One pass over the evidence builds the quote-gate sources and the audit pool.
+        source_quotes = []
+        pool = []
+        for item in evidence_payload.get("evidence", []):
+            if item.get("sourceType") == "annotation" and item.get("highlightedText"):
+                source_quotes.append(
+                    {
+                        "annotationId": item.get("annotationId"),
+                        "highlightedText": item.get("highlightedText"),
+                    }
+                )
+            entry = pool_entry(item)
+            if entry is not None:
+                pool.append(entry)
         draft_quotes = [{"text": q} for q in extract_quotes(draft_text)]
         verify_results = verify(draft_quotes, source_quotes)
         quote_report_md = os.path.join(out_dir, "quote_verification_report.md")
-        with open(quote_report_md, "w", encoding="utf-8") as fh:
-            fh.write(result_to_markdown(verify_results))
+        with open_report(quote_report_md) as fh:
+            write_result_markdown(fh, verify_results)
 
         quote_fail = any(r.get("status") not in ("EXACT_MATCH", "TRUNCATED_OK") for r in verify_results)
 
         # Claim audit.
-        audit_report = audit(draft_text, evidence_payload)
+        audit_report = audit(draft_text, pool)
         audit_json_path = os.path.join(out_dir, "claim_audit.json")
         write_json(audit_json_path, audit_report)
         audit_md_path = os.path.join(out_dir, "claim_audit.md")
@@ -1,8 +1,19 @@
 #!/usr/bin/env python3
+import functools
 import json
 import re
 import sys
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # Optional speedup; stdlib json is the fallback.
+    orjson = None
+
+_ELLIPSIS_SPLIT_RE = re.compile(r"\[\.\.\.\]|\.{3}|\[\u2026\]|\u2026")
+_HYPHEN_RE = re.compile(r"\b[a-zA-Z]{1,2}-\s+[a-zA-Z]{2,}\b")
+_SPACED_UPPER_RE = re.compile(r"\b[A-Z](?:\s+[A-Z]){5,}\b")
+_NON_ASCII_RE = re.compile(r"[^\x09\x0A\x0D\x20-\x7E]")
 
 
 def normalize_truncation_markers(text: str) -> str:
@@ -16,16 +27,16 @@ def normalize_truncation_markers(text: str) -> str:
     return " ".join(stripped.split())
 
 
-def is_truncated_match(draft_text: str, source_text: str) -> bool:
-    if not source_text or not draft_text:
-        return False
-
-    # Split on common ellipsis markers and ensure segments appear in order.
-    parts = [
+def truncation_parts(draft_text: str) -> List[str]:
+    # Split on common ellipsis markers; segments must appear in the source in order.
+    return [
         " ".join(part.split())
-        for part in re.split(r"\[\.\.\.\]|\.{3}|\[\u2026\]|\u2026", draft_text)
+        for part in _ELLIPSIS_SPLIT_RE.split(draft_text)
         if part.strip()
     ]
+
+
+def parts_in_order(parts: List[str], source_text: str) -> bool:
     if not parts:
         return False
 
@@ -43,59 +54,111 @@ def best_similarity(a: str, b: str) -> float:
         return 1.0
     if not a or not b:
         return 0.0
-    overlap = sum(1 for x, y in zip(a, b) if x == y)
+    if a.isascii() and b.isascii():
+        # XOR the ASCII bytes as one big integer; equal positions become zero bytes.
+        n = min(len(a), len(b))
+        diff = int.from_bytes(a[:n].encode("ascii"), "big") ^ int.from_bytes(b[:n].encode("ascii"), "big")
+        overlap = diff.to_bytes(n, "big").count(0)
+    else:
+        overlap = sum(1 for x, y in zip(a, b) if x == y)
     return overlap / max(len(a), len(b), 1)
 
 
-def detect_ocr_artifact(text: str) -> List[str]:
+def similarity_key(text: str) -> Optional[int]:
+    return int.from_bytes(text.encode("ascii"), "big") if text.isascii() else None
+
+
+def closest_source(draft_text: str, candidates: List[Tuple[str, Optional[int]]]) -> Tuple[str, float]:
+    # Same scores as best_similarity, with each text's integer form built once and
+    # shifted down to the common prefix length per pair.
+    best = ""
+    best_ratio = 0.0
+    draft_key = similarity_key(draft_text)
+    len_a = len(draft_text)
+    for source_text, source_key in candidates:
+        len_b = len(source_text)
+        if len_a and len_b:
+            n = min(len_a, len_b)
+            longest = max(len_a, len_b)
+            # Overlap is at most the shorter length, so this source cannot win.
+            if n / longest <= best_ratio:
+                continue
+        if draft_key is not None and source_key is not None and len_a and len_b:
+            diff = (draft_key >> 8 * (len_a - n)) ^ (source_key >> 8 * (len_b - n))
+            ratio = diff.to_bytes(n, "big").count(0) / longest
+        else:
+            ratio = best_similarity(draft_text, source_text)
+        if ratio > best_ratio:
+            best_ratio = ratio
+            best = source_text
+    return best, best_ratio
+
+
+# The same source is re-scanned each time it matches a draft; the tuple result
+# keeps cached entries immutable, so callers copy it into a list.
+@functools.lru_cache(maxsize=4096)
+def detect_ocr_artifact(text: str) -> Tuple[str, ...]:
     reasons: List[str] = []
     if not text:
-        return reasons
+        return ()
 
     if "�" in text:
         reasons.append("replacement-character")
-    if re.search(r"\b[a-zA-Z]{1,2}-\s+[a-zA-Z]{2,}\b", text):
+    if _HYPHEN_RE.search(text):
         reasons.append("line-break-hyphenation")
-    if re.search(r"\b[A-Z](?:\s+[A-Z]){5,}\b", text):
+    if _SPACED_UPPER_RE.search(text):
         reasons.append("spaced-uppercase-run")
-    if re.search(r"[^\x09\x0A\x0D\x20-\x7E]", text):
+    if _NON_ASCII_RE.search(text):
         reasons.append("non-ascii-glyphs")
-    return reasons
+    return tuple(reasons)
 
 
 def verify(draft_quotes: List[Dict[str, Any]], source_quotes: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     results: List[Dict[str, Any]] = []
+    # Source fields are read once here rather than once per (draft, source) pair.
+    sources = [(str(source.get("highlightedText", "")), source.get("annotationId")) for source in source_quotes]
+    # Built on the first MISMATCH only; most drafts match a source directly.
+    candidates: Optional[List[Tuple[str, Optional[int]]]] = None
+    exact_index: Dict[str, List[Any]] = {}
+    for source_text, source_id in sources:
+        exact_index.setdefault(source_text, []).append(source_id)
 
     for idx, draft in enumerate(draft_quotes):
         draft_text = str(draft.get("text", ""))
         draft_source_id = draft.get("sourceAnnotationId")
-        matched = False
 
-        for source in source_quotes:
-            source_text = str(source.get("highlightedText", ""))
-            source_id = source.get("annotationId")
+        # An exact match wins over containment hits on earlier sources, so a source
+        # that is a substring of the matched one cannot flag EXPANDED_ERROR.
+        exact_ids = [
+            source_id
+            for source_id in exact_index.get(draft_text, ())
+            if not (draft_source_id and source_id and str(draft_source_id) != str(source_id))
+        ]
+        if exact_ids:
+            ocr_reasons = list(detect_ocr_artifact(draft_text))
+            results.append(
+                {
+                    "quote_index": idx,
+                    "status": "EXACT_MATCH",
+                    "draft": draft_text[:120],
+                    "sourceAnnotationId": exact_ids[0],
+                    "ocrArtifactWarning": bool(ocr_reasons),
+                    "ocrArtifactReasons": ocr_reasons,
+                }
+            )
+            continue
+
+        trimmed = normalize_truncation_markers(draft_text)
+        parts = truncation_parts(draft_text)
+        matched = False
 
+        # Sources are tried in order and the first one passing any check wins.
+        for source_text, source_id in sources:
             if draft_source_id and source_id and str(draft_source_id) != str(source_id):
                 continue
 
-            if draft_text == source_text:
-                ocr_reasons = detect_ocr_artifact(source_text)
-                results.append(
-                    {
-                        "quote_index": idx,
-                        "status": "EXACT_MATCH",
-                        "draft": draft_text[:120],
-                        "sourceAnnotationId": source_id,
-                        "ocrArtifactWarning": bool(ocr_reasons),
-                        "ocrArtifactReasons": ocr_reasons,
-                    }
-                )
-                matched = True
-                break
-
-            trimmed = normalize_truncation_markers(draft_text)
             if trimmed and trimmed in source_text:
-                ocr_reasons = detect_ocr_artifact(source_text)
+                ocr_reasons = list(detect_ocr_artifact(source_text))
                 results.append(
                     {
                         "quote_index": idx,
@@ -109,8 +172,8 @@ def verify(draft_quotes: List[Dict[str, Any]], source_quotes: List[Dict[str, Any
                 matched = True
                 break
 
-            if is_truncated_match(draft_text, source_text):
-                ocr_reasons = detect_ocr_artifact(source_text)
+            if parts_in_order(parts, source_text):
+                ocr_reasons = list(detect_ocr_artifact(source_text))
                 results.append(
                     {
                         "quote_index": idx,
@@ -152,14 +215,9 @@ def verify(draft_quotes: List[Dict[str, Any]], source_quotes: List[Dict[str, Any
             )
             continue
 
-        best = ""
-        best_ratio = 0.0
-        for source in source_quotes:
-            source_text = str(source.get("highlightedText", ""))
-            ratio = best_similarity(draft_text, source_text)
-            if ratio > best_ratio:
-                best_ratio = ratio
-                best = source_text
+        if candidates is None:
+            candidates = [(source_text, similarity_key(source_text)) for source_text, _ in sources]
+        best, best_ratio = closest_source(draft_text, candidates)
 
         results.append(
             {
@@ -176,7 +234,7 @@ def verify(draft_quotes: List[Dict[str, Any]], source_quotes: List[Dict[str, Any
 
 
 def main() -> int:
-    payload = json.load(sys.stdin)
+    payload = orjson.loads(sys.stdin.buffer.read()) if orjson is not None else json.load(sys.stdin)
     draft_quotes = payload.get("draft_quotes", [])
     source_quotes = payload.get("source_quotes", [])
 
@@ -11,21 +11,9 @@ Progress lines are written to stderr.
 import argparse
 import json
 import os
+import queue
 import sys
-import tempfile
-
-
-def _get_page_count(pdf_path: str) -> int:
-    """Get the number of pages in a PDF."""
-    try:
-        import fitz
-        doc = fitz.open(pdf_path)
-        count = len(doc)
-        doc.close()
-        return count
-    except ImportError:
-        print("PyMuPDF not installed, cannot count pages", file=sys.stderr)
-        return 0
+import threading
 
 
 def _resize_if_needed(img, max_dim: int = 4096):
@@ -42,44 +30,67 @@ def _resize_if_needed(img, max_dim: int = 4096):
         return cv2.resize(img, (new_w, new_h), interpolation=cv2.INTER_AREA)
     except ImportError:
         from PIL import Image
+        # BOX is PIL's area-averaging filter, matching INTER_AREA above, and is
+        # much cheaper than LANCZOS for large downscales.
         pil_img = Image.fromarray(img)
-        pil_img = pil_img.resize((new_w, new_h), Image.LANCZOS)
-        return np.array(pil_img)
+        pil_img = pil_img.resize((new_w, new_h), Image.BOX)
+        return np.asarray(pil_img)
 
 
-def _run_ppocr(image_path: str) -> str:
-    """Run PaddleOCR on a single image and return extracted text."""
-    try:
-        from paddleocr import PaddleOCR
-    except ImportError:
-        print("PaddleOCR not installed. Install with: pip install paddleocr", file=sys.stderr)
-        sys.exit(1)
+_OCR = None
 
-    import numpy as np
-    try:
-        import cv2
-        img = cv2.imread(image_path)
-        if img is None:
-            return ""
-    except ImportError:
-        from PIL import Image
-        img = np.array(Image.open(image_path))
 
-    img = _resize_if_needed(img)
+def _get_ocr():
+    """Load the PaddleOCR model once per process; construction reads weights from disk."""
+    global _OCR
+    if _OCR is None:
+        try:
+            from paddleocr import PaddleOCR
+        except ImportError:
+            print("PaddleOCR not installed. Install with: pip install paddleocr", file=sys.stderr)
+            sys.exit(1)
+        _OCR = PaddleOCR(use_angle_cls=True, lang="en", show_log=False)
+    return _OCR
+
 
-    ocr = PaddleOCR(use_angle_cls=True, lang="en", show_log=False)
-    result = ocr.ocr(img, cls=True)
+def _run_ppocr(img) -> str:
+    """Run PaddleOCR on a single page image array and return extracted text."""
+    img = _resize_if_needed(img)
+    result = _get_ocr().ocr(img, cls=True)
 
     if not result or not result[0]:
         return ""
 
-    lines = []
-    for line in result[0]:
-        if line and len(line) >= 2:
-            text = line[1][0] if isinstance(line[1], (list, tuple)) else str(line[1])
-            lines.append(text)
+    return "\n".join(
+        line[1][0] if isinstance(line[1], (list, tuple)) else str(line[1])
+        for line in result[0]
+        if line and len(line) >= 2
+    )
+
+
+def _pixmap_to_array(pix):
+    """Convert a PyMuPDF pixmap to a BGR uint8 array, the layout cv2.imread produced."""
+    import numpy as np
+    img = np.frombuffer(pix.samples, dtype=np.uint8).reshape(pix.height, pix.width, pix.n)
+    if pix.n < 3:
+        return np.repeat(img[:, :, :1], 3, axis=2)
+    # Drop alpha if present and swap RGB to BGR.
+    return np.ascontiguousarray(img[:, :, 2::-1])
 
-    return "\n".join(lines)
+
+def _render_pages(doc, matrix, pages: "queue.Queue", stop: threading.Event, errors: list):
+    """Producer: rasterize pages into the queue, then put a None sentinel."""
+    try:
+        for page_num in range(len(doc)):
+            if stop.is_set():
+                break
+            # Hand the rendered pixels straight to OCR; no PNG encode/decode or temp file.
+            pix = doc[page_num].get_pixmap(matrix=matrix)
+            pages.put(_pixmap_to_array(pix))
+    except BaseException as exc:
+        errors.append(exc)
+    finally:
+        pages.put(None)
 
 
 def mode_ocr(pdf_path: str, dpi: int = 200) -> str:
@@ -96,28 +107,35 @@ def mode_ocr(pdf_path: str, dpi: int = 200) -> str:
     matrix = fitz.Matrix(zoom, zoom)
 
     all_text = []
-    tmpdir = tempfile.mkdtemp(prefix="ppocr_")
-
-    try:
-        for page_num in range(total_pages):
-            print(f"Processing page {page_num + 1}/{total_pages}...", file=sys.stderr)
-
-            page = doc[page_num]
-            pix = page.get_pixmap(matrix=matrix)
-            img_path = os.path.join(tmpdir, f"page_{page_num + 1}.png")
-            pix.save(img_path)
 
-            page_text = _run_ppocr(img_path)
-            all_text.append(page_text)
+    # Render the next pages on a background thread while OCR (which releases the
+    # GIL inside Paddle) works on the current one. The small bound caps memory at a
+    # couple of full-resolution page images.
+    pages = queue.Queue(maxsize=2)
+    stop = threading.Event()
+    errors = []
+    producer = threading.Thread(target=_render_pages, args=(doc, matrix, pages, stop, errors), daemon=True)
+    producer.start()
 
-            # Clean up image
-            os.remove(img_path)
+    try:
+        while True:
+            img = pages.get()
+            if img is None:
+                break
+            print(f"Processing page {len(all_text) + 1}/{total_pages}...", file=sys.stderr)
+            all_text.append(_run_ppocr(img))
     finally:
+        # Unblock and finish the producer before the document is closed under it.
+        stop.set()
+        while producer.is_alive():
+            try:
+                pages.get(timeout=0.1)
+            except queue.Empty:
+                pass
         doc.close()
-        try:
-            os.rmdir(tmpdir)
-        except OSError:
-            pass
+
+    if errors:
+        raise errors[0]
 
     return "\f".join(all_text)
 